@@ -24,14 +24,20 @@ Example (fluent style):
 from __future__ import annotations
 
 import builtins
+import concurrent.futures
 import functools
 import itertools
+import math
+import operator
+import sys
 from collections.abc import Callable, Iterable, Iterator
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
 
 from expression.core import (
+    Nothing,
     Option,
     PipeMixin,
+    Some,
     SupportsGreaterThan,
     SupportsLessThan,
     SupportsSum,
@@ -86,10 +92,10 @@ class Seq(Iterable[_TSource], PipeMixin):
         Wraps the given enumerations as a single concatenated
         enumeration.
         """
-        return Seq(concat(self._value, *others))
+        return Seq(concat(self, *others))
 
     def filter(self, predicate: Callable[[_TSource], bool]) -> Seq[_TSource]:
-        return Seq(filter(predicate)(self))
+        return _Pipeline.defer(self, "filter", predicate)
 
     def choose(self, chooser: Callable[[_TSource], Option[_TResult]]) -> Seq[_TResult]:
         """Choose items from the sequence.
@@ -109,8 +115,7 @@ class Seq(Iterable[_TSource], PipeMixin):
         return Seq(xs)
 
     def collect(self, mapping: Callable[[_TSource], Seq[_TResult]]) -> Seq[_TResult]:
-        xs = pipe(self, collect(mapping))
-        return Seq(xs)
+        return _Pipeline.defer(self, "collect", mapping)
 
     @staticmethod
     def delay(generator: Callable[[], Iterable[_TSource]]) -> Iterable[_TSource]:
@@ -132,6 +137,20 @@ class Seq(Iterable[_TSource], PipeMixin):
         """Returns empty sequence."""
         return Seq()
 
+    def find(self, predicate: Callable[[_TSource], bool]) -> _TSource:
+        """Find the first element satisfying the predicate.
+
+        Args:
+            predicate: The function to test the elements with.
+
+        Returns:
+            The first element for which the predicate returns `True`.
+
+        Raises:
+            Raises `ValueError` if no element satisfies the predicate.
+        """
+        return pipe(self, find(predicate))
+
     def fold(self, folder: Callable[[_TState, _TSource], _TState], state: _TState) -> _TState:
         """Fold sequence.
 
@@ -149,7 +168,10 @@ class Seq(Iterable[_TSource], PipeMixin):
             The state object after the folding function is applied to
             each element of the sequence.
         """
-        return functools.reduce(folder, self, state)
+        # Lists and tuples have no faster path than reduce, except math.prod
+        if isinstance(self._value, list | tuple) and folder is not operator.mul:
+            return functools.reduce(folder, self._value, state)
+        return _fold(self, folder, state)
 
     def head(self) -> _TSource:
         """Returns the first element of the sequence."""
@@ -172,7 +194,7 @@ class Seq(Iterable[_TSource], PipeMixin):
         Returns:
             The result sequence.
         """
-        return Seq(pipe(self, map(mapper)))
+        return _Pipeline.defer(self, "map", mapper)
 
     @overload
     def starmap(self: Seq[tuple[_T1, _T2]], mapping: Callable[[_T1, _T2], _TResult]) -> Seq[_TResult]:
@@ -206,7 +228,8 @@ class Seq(Iterable[_TSource], PipeMixin):
         Returns:
             Partially applied map function.
         """
-        return Seq(starmap(mapping)(self))
+        xs = starmap(mapping)(self)
+        return xs if isinstance(xs, Seq) else Seq(xs)
 
     def mapi(self, mapping: Callable[[int, _TSource], _TResult]) -> Seq[_TResult]:
         """Map list with index.
@@ -225,6 +248,79 @@ class Seq(Iterable[_TSource], PipeMixin):
         """
         return Seq(mapi(mapping)(self))
 
+    def map_filter_fold(
+        self,
+        mapper: Callable[[_TSource], _TResult],
+        predicate: Callable[[_TResult], bool],
+        folder: Callable[[_TState, _TResult], _TState],
+        state: _TState,
+    ) -> _TState:
+        """Map, filter and fold sequence in a single pass.
+
+        Same as `self.map(mapper).filter(predicate).fold(folder, state)`,
+        which is fused into this automatically.
+
+        Args:
+            mapper: A function to transform items from the input sequence.
+            predicate: A function to test whether each mapped item should
+                be folded.
+            folder: A function that updates the state with each mapped
+                item.
+            state: The initial state.
+
+        Returns:
+            The state object after the folding function is applied to
+            each mapped item that satisfies the predicate.
+        """
+        return pipe(self, map_filter_fold(mapper, predicate, folder, state))
+
+    def par_fold(
+        self,
+        folder: Callable[[_TSource, _TSource], _TSource],
+        state: _TSource,
+        workers: int | None = None,
+        chunk_size: int = 1000,
+    ) -> _TSource:
+        """Fold sequence in parallel.
+
+        Folds chunks of the sequence on a pool of worker threads, then
+        folds the results of the chunks starting with the initial
+        state. The folder must be associative, use `fold` otherwise.
+
+        Args:
+            folder: An associative function that combines two elements.
+            state: The initial state.
+            workers: The maximum number of worker threads.
+            chunk_size: The number of elements folded per task.
+
+        Returns:
+            The state object after the folding function is applied to
+            each element of the sequence.
+        """
+        return pipe(self, par_fold(folder, state, workers=workers, chunk_size=chunk_size))
+
+    def par_map(
+        self,
+        mapper: Callable[[_TSource], _TResult],
+        workers: int | None = None,
+        chunk_size: int = 1000,
+    ) -> Seq[_TResult]:
+        """Map sequence in parallel.
+
+        Like map, but applies the mapper to chunks of the sequence on a
+        pool of worker threads. Worth it when the mapper releases the
+        GIL, e.g NumPy or Numba `nogil` functions.
+
+        Args:
+            mapper: A function to transform items from the input sequence.
+            workers: The maximum number of worker threads.
+            chunk_size: The number of elements mapped per task.
+
+        Returns:
+            The result sequence.
+        """
+        return Seq(pipe(self, par_map(mapper, workers=workers, chunk_size=chunk_size)))
+
     @overload
     @staticmethod
     def range(stop: int) -> Iterable[int]:
@@ -258,7 +354,9 @@ class Seq(Iterable[_TSource], PipeMixin):
         Returns:
             The resulting sequence of computed states.
         """
-        return Seq(itertools.accumulate(self._value, scanner, initial=state))
+        if isinstance(self._value, list | tuple):
+            return Seq(itertools.accumulate(self._value, scanner, initial=state))
+        return Seq(_scan(self, scanner, state))
 
     def skip(self, count: int) -> Seq[_TSource]:
         """Skip elements from sequence.
@@ -351,7 +449,7 @@ class Seq(Iterable[_TSource], PipeMixin):
         Returns:
             The result sequence.
         """
-        return builtins.zip(self, other)
+        return pipe(other, zip(self))
 
     def __iter__(self) -> Iterator[_TSource]:
         """Return iterator for sequence."""
@@ -377,6 +475,192 @@ class Seq(Iterable[_TSource], PipeMixin):
         return repr(self)
 
 
+class _Pipeline(Seq[_TSource]):
+    """Sequence with deferred operators.
+
+    Instead of wrapping the source in a new generator for each stage,
+    the operators are recorded on the sequence and the whole pipeline
+    is materialized by `_run` when iteration begins.
+    """
+
+    def __init__(self, source: Iterable[Any], ops: tuple[tuple[str, Callable[..., Any]], ...]) -> None:
+        super().__init__(source)
+        self.ops = ops
+
+    @staticmethod
+    def defer(source: Iterable[Any], op: str, fn: Callable[..., Any]) -> Seq[Any]:
+        """Append a deferred operator to the pipeline of the source.
+
+        Unary NumPy ufuncs applied directly to a 1-D array are evaluated
+        eagerly, vectorized over the whole array.
+        """
+        arr = _ndarray(source)
+        if arr is not None and op in ("map", "filter"):
+            np = sys.modules["numpy"]
+            ufunc = cast(Any, fn)
+            if isinstance(ufunc, np.ufunc) and ufunc.nin == 1 and ufunc.nout == 1:
+                return Seq(ufunc(arr) if op == "map" else arr[ufunc(arr).astype(bool)])
+
+        if isinstance(source, _Pipeline):
+            return _Pipeline(source._value, (*source.ops, (op, fn)))
+        return _Pipeline(source, ((op, fn),))
+
+    @staticmethod
+    def unwrap(source: Iterable[Any]) -> Iterable[Any]:
+        """Return the wrapped value of a sequence with no deferred operators."""
+        if isinstance(source, Seq) and not isinstance(source, _Pipeline):
+            return source._value
+        return source
+
+    def fold(self, folder: Callable[[_TState, _TSource], _TState], state: _TState) -> _TState:
+        return _fold(self, folder, state)
+
+    def scan(self, scanner: Callable[[_TState, _TSource], _TState], state: _TState) -> Iterable[_TState]:
+        return Seq(_scan(self, scanner, state))
+
+    def prefix(self, count: int) -> Seq[Any]:
+        """Return the sequence without its last count deferred operators."""
+        return _Pipeline(self._value, self.ops[:-count])
+
+    def __iter__(self) -> Iterator[_TSource]:
+        return _run(self._value, self.ops)
+
+
+def _run(source: Iterable[Any], ops: tuple[tuple[str, Callable[..., Any]], ...]) -> Iterator[Any]:
+    """Materialize a deferred pipeline.
+
+    Each stage is stacked as a C-level iterator (`builtins.map`,
+    `builtins.filter`, `itertools.chain.from_iterable`), so no Python
+    generator frame is resumed between the user supplied functions.
+    """
+    it: Iterable[Any] = source
+    for op, fn in ops:
+        if op == "map":
+            it = builtins.map(fn, it)
+        elif op == "filter":
+            it = builtins.filter(fn, it)
+        else:
+            it = itertools.chain.from_iterable(builtins.map(fn, it))
+
+    return builtins.iter(it)
+
+
+def _ndarray(source: Iterable[Any]) -> Any:
+    """Return the source if it is a 1-D NumPy array, else `None`.
+
+    NumPy is not a dependency and is never imported here. If the user
+    has not imported it then the source cannot be an array.
+    """
+    source = _Pipeline.unwrap(source)
+    np = sys.modules.get("numpy")
+    if np is not None and isinstance(source, np.ndarray) and cast(Any, source).ndim == 1:
+        return source
+    return None
+
+
+def _ufunc_operands(folder: Callable[..., Any], state: Any, arr: Any) -> tuple[Any, Any] | None:
+    """Return the ufunc that combines elements like folder, and the operands.
+
+    The operands are the array with the state prepended, in the dtype
+    that Python arithmetic between the state and the elements gives
+    (NEP 50 weak scalar promotion), so narrow dtypes wrap on overflow
+    the same way. Returns `None` if folding with the ufunc could give a
+    different result than folding with folder.
+    """
+    np = sys.modules["numpy"]
+    kind = arr.dtype.kind
+    if not isinstance(state, int | float | complex | np.generic):
+        return None
+
+    if folder is operator.add and kind in "biufc":
+        ufunc = np.add
+    elif folder is operator.mul and kind in "biufc":
+        ufunc = np.multiply
+    # NaN compares differently with builtins.max/min, so only integers. The
+    # state is compared, not combined, so it must fit the dtype unchanged.
+    elif (folder is builtins.max or folder is builtins.min) and kind in "iu":
+        info = np.iinfo(arr.dtype)
+        if not isinstance(state, int | np.integer) or not info.min <= state <= info.max:
+            return None
+        ufunc = np.maximum if folder is builtins.max else np.minimum
+    else:
+        return None
+
+    operands = np.empty(len(arr) + 1, dtype=np.result_type(state, arr))
+    operands[0] = state
+    operands[1:] = arr
+    return ufunc, operands
+
+
+def _jitted(fn: Callable[..., Any]) -> bool:
+    """Return `True` if fn is a function compiled with Numba.
+
+    Like NumPy, Numba is never imported here. Jitted folders and
+    projections are the opt-in for running a reduction as a Numba
+    kernel, since compiling arbitrary Python functions on every call
+    would cost far more than it saves.
+    """
+    numba = sys.modules.get("numba")
+    return numba is not None and numba.extending.is_jitted(fn)
+
+
+@functools.cache
+def _numba_kernels() -> tuple[dict[str, Any], type[Exception]]:
+    """Compile the Numba kernels for jitted folders and projections.
+
+    Returns the kernels by name, and the Numba error raised when a
+    kernel fails to compile for the given arguments.
+    """
+    from numba import njit as jit  # type: ignore
+    from numba.core.errors import NumbaError  # type: ignore
+
+    njit = cast(Callable[[Callable[..., Any]], Any], jit)
+
+    @njit
+    def fold(folder: Any, arr: Any, state: Any) -> Any:
+        for i in builtins.range(arr.size):
+            state = folder(state, arr[i])
+        return state
+
+    @njit
+    def scan(scanner: Any, arr: Any, state: Any, out: Any) -> Any:
+        out[0] = state
+        for i in builtins.range(arr.size):
+            state = scanner(state, arr[i])
+            out[i + 1] = state
+        return out
+
+    @njit
+    def max_by(projection: Any, arr: Any) -> Any:
+        value = projection(arr[0])
+        for i in builtins.range(1, arr.size):
+            item = projection(arr[i])
+            if item > value:
+                value = item
+        return value
+
+    @njit
+    def min_by(projection: Any, arr: Any) -> Any:
+        value = projection(arr[0])
+        for i in builtins.range(1, arr.size):
+            item = projection(arr[i])
+            if item < value:
+                value = item
+        return value
+
+    kernels = {"fold": fold, "scan": scan, "max_by": max_by, "min_by": min_by}
+    return kernels, cast(type[Exception], NumbaError)
+
+
+def _numba_call(kernel: str, *args: Any) -> Option[Any]:
+    """Run the named Numba kernel, or return `Nothing` if it fails to compile."""
+    kernels, error = _numba_kernels()
+    try:
+        return Some(kernels[kernel](*args))
+    except error:
+        return Nothing
+
+
 class SeqGen(Iterable[_TSource]):
     """Sequence from a generator function.
 
@@ -392,6 +676,20 @@ class SeqGen(Iterable[_TSource]):
         return builtins.iter(xs)
 
 
+class _ZippedArrays(Iterable[tuple[Any, ...]]):
+    """Zipped NumPy arrays kept as separate columns.
+
+    Tuples are only created if the pairs are iterated. Starmapping a
+    ufunc over the columns is vectorized instead.
+    """
+
+    def __init__(self, *cols: Any) -> None:
+        self.cols = cols
+
+    def __iter__(self) -> Iterator[tuple[Any, ...]]:
+        return builtins.zip(*self.cols)
+
+
 def append(
     *others: Iterable[_TSource],
 ) -> Callable[[Iterable[_TSource]], Iterable[_TSource]]:
@@ -434,11 +732,7 @@ def collect(
     source: Iterable[_TSource],
     mapping: Callable[[_TSource], Iterable[_TResult]],
 ) -> Iterable[_TResult]:
-    def gen() -> Iterator[_TResult]:
-        for xs in source:
-            yield from mapping(xs)
-
-    return SeqGen(gen)
+    return _Pipeline.defer(source, "collect", mapping)
 
 
 def concat(*iterables: Iterable[_TSource]) -> Iterable[_TSource]:
@@ -455,8 +749,7 @@ def concat(*iterables: Iterable[_TSource]) -> Iterable[_TSource]:
     """
 
     def gen() -> Iterator[_TSource]:
-        for it in iterables:
-            yield from it
+        return itertools.chain.from_iterable(iterables)
 
     return SeqGen(gen)
 
@@ -496,7 +789,30 @@ def filter(source: Iterable[_TSource], predicate: Callable[[_TSource], bool]) ->
     Returns:
         A partially applied filter function.
     """
-    return builtins.filter(predicate, source)
+    return _Pipeline.defer(source, "filter", predicate)
+
+
+@curry_flip(1)
+def find(source: Iterable[_TSource], predicate: Callable[[_TSource], bool]) -> _TSource:
+    """Find the first element satisfying the predicate.
+
+    Iteration stops at the first match, so deferred mappers are not
+    applied to the rest of the sequence.
+
+    Args:
+        source: The input sequence.
+        predicate: The function to test the elements with.
+
+    Returns:
+        The first element for which the predicate returns `True`.
+
+    Raises:
+        Raises `ValueError` if no element satisfies the predicate.
+    """
+    for x in source:
+        if predicate(x):
+            return x
+    raise ValueError("Sequence contains no matching element")
 
 
 @curry_flip(1)
@@ -523,6 +839,50 @@ def fold(
         returns the state object after the folding function is applied
         to each element of the sequence.
     """
+    return _fold(source, folder, state)
+
+
+def _fold(
+    source: Iterable[_TSource],
+    folder: Callable[[_TState, _TSource], _TState],
+    state: _TState,
+) -> _TState:
+    """Fold elements in sequence, without the currying of `fold`."""
+    arr = _ndarray(source)
+    if arr is not None:
+        match _ufunc_operands(folder, state, arr) if len(arr) else None:
+            # Pairwise summation would round floats differently from a left fold
+            case (ufunc, operands) if operands.dtype.kind in "fc":
+                return ufunc.accumulate(operands, dtype=operands.dtype)[-1]
+            case (ufunc, operands):
+                result = ufunc.reduce(operands, dtype=operands.dtype)
+                # A left fold with max or min returns the state object itself when it wins
+                if (folder is builtins.max or folder is builtins.min) and result == state:
+                    return state
+                return result
+            case _:
+                pass
+
+        if _jitted(folder):
+            match _numba_call("fold", folder, arr, state):
+                case Option(tag="some", some=result):
+                    return result
+                case _:
+                    pass
+
+    # math.prod multiplies left to right in C, without a Python call per
+    # element. operator.add is left out: from Python 3.12 sum adds floats
+    # with compensated summation, which is not a strict left fold.
+    if folder is operator.mul:
+        return cast(_TState, math.prod(cast(Iterable[Any], source), start=cast(Any, state)))
+
+    if isinstance(source, _Pipeline):
+        match source.ops[-2:]:
+            case (("map", mapper), ("filter", predicate)):
+                return map_filter_fold(mapper, predicate, folder, state)(source.prefix(2))
+            case _:
+                pass
+
     return functools.reduce(folder, source, state)
 
 
@@ -552,7 +912,19 @@ def fold_back(
             The state object after the folding function is applied
             to each element of the sequence.
         """
-        return functools.reduce(lambda x, y: folder(y, x), reversed(list(source)), state)
+        xs: Iterable[_TSource]
+        value = _Pipeline.unwrap(source)
+        arr = _ndarray(value)
+        if arr is not None:
+            xs = arr[::-1]
+        elif isinstance(value, list | tuple):
+            xs = reversed(cast(list[_TSource] | tuple[_TSource, ...], value))
+        else:
+            xs = reversed(list(source))
+
+        for x in xs:
+            state = folder(x, state)
+        return state
 
     return _fold_back
 
@@ -569,23 +941,34 @@ def head(source: Iterable[_TSource]) -> _TSource:
     Raises:
         Raises `ValueError` if the source sequence is empty.
     """
-    for value in source:
-        return value
-
-    raise ValueError("Sequence contains no elements")
+    try:
+        return next(builtins.iter(source))
+    except StopIteration:
+        raise ValueError("Sequence contains no elements") from None
 
 
-def init_infinite(initializer: Callable[[int], _TSource]) -> Iterable[_TSource]:
+def init_infinite(initializer: Callable[[int], _TSource], *, cache: int = 0) -> Iterable[_TSource]:
     """Generate infinite sequence.
 
     Generates a new sequence which, when iterated, will return
-    successive elements by calling the given function. The results of
-    calling the function will not be saved, that is the function will be
-    reapplied as necessary to regenerate the elements. The function is
-    passed the index of the item being generated.
+    successive elements by calling the given function. The function is
+    passed the index of the item being generated. With `cache=0` the
+    results of calling the function will not be saved, that is the
+    function will be reapplied as necessary to regenerate the elements.
 
     Iteration can continue up to `sys.maxsize`.
+
+    Args:
+        initializer: A function that generates an item given its index.
+        cache: Keep the results of the most recent `cache` indices, so
+            they are not regenerated when the sequence is iterated
+            again. Zero (the default) disables caching. The cache is
+            least recently used, so if iteration restarts from index 0
+            after more than `cache` items, every index has already been
+            evicted and nothing is reused.
     """
+    if cache > 0:
+        initializer = functools.lru_cache(maxsize=cache)(initializer)
 
     class Infinite(Iterable[_TResult]):
         """An infinite iterable.
@@ -641,12 +1024,7 @@ def map(source: Iterable[_TSource], mapper: Callable[[_TSource], _TResult]) -> I
     Returns:
         Partially applied map function.
     """
-
-    def gen():
-        for x in source:
-            yield mapper(x)
-
-    return SeqGen(gen)
+    return _Pipeline.defer(source, "map", mapper)
 
 
 @overload
@@ -685,7 +1063,17 @@ def starmap(mapper: Callable[..., Any]) -> Callable[[Iterable[Any]], Iterable[An
     def mapper_(args: tuple[Any, ...]) -> Any:
         return mapper(*args)
 
-    return map(mapper_)
+    def _starmap(source: Iterable[Any]) -> Iterable[Any]:
+        source = _Pipeline.unwrap(source)
+        if isinstance(source, _ZippedArrays):
+            np = sys.modules["numpy"]
+            ufunc = cast(Any, mapper)
+            if isinstance(ufunc, np.ufunc) and ufunc.nin == len(source.cols) and ufunc.nout == 1:
+                return Seq(ufunc(*source.cols))
+
+        return pipe(source, map(mapper_))
+
+    return _starmap
 
 
 def map2(mapper: Callable[[_T1, _T2], _TResult]) -> Callable[[Iterable[tuple[_T1, _T2]]], Iterable[_TResult]]:
@@ -716,6 +1104,42 @@ def mapi(source: Iterable[_TSource], mapping: Callable[[int, _TSource], _TResult
     return (*itertools.starmap(mapping, builtins.enumerate(source)),)
 
 
+@curry_flip(1)
+def map_filter_fold(
+    source: Iterable[_TSource],
+    mapper: Callable[[_TSource], _TResult],
+    predicate: Callable[[_TResult], bool],
+    folder: Callable[[_TState, _TResult], _TState],
+    state: _TState,
+) -> _TState:
+    """Map, filter and fold sequence in a single pass.
+
+    Same as `pipe(source, map(mapper), filter(predicate), fold(folder,
+    state))`, but without stacking iterators. The mapped value of each
+    element is computed once and used for both the predicate and the
+    folder. `fold` uses this automatically for sequences ending with a
+    map followed by a filter.
+
+    Args:
+        source: The input sequence.
+        mapper: A function to transform items from the input sequence.
+        predicate: A function to test whether each mapped item should
+            be folded.
+        folder: A function that updates the state with each mapped item.
+        state: The initial state.
+
+    Returns:
+        Partially applied fold function that takes a source sequence and
+        returns the state object after the folding function is applied
+        to each mapped item that satisfies the predicate.
+    """
+    for x in source:
+        y = mapper(x)
+        if predicate(y):
+            state = folder(state, y)
+    return state
+
+
 def max(source: Iterable[_TSupportsGreaterThan]) -> _TSupportsGreaterThan:
     """Return maximum of all elements.
 
@@ -730,7 +1154,15 @@ def max(source: Iterable[_TSupportsGreaterThan]) -> _TSupportsGreaterThan:
 def max_by(
     source: Iterable[_TSource], projection: Callable[[_TSource], _TSupportsGreaterThan]
 ) -> _TSupportsGreaterThan:
-    return builtins.max(projection(x) for x in source)
+    arr = _ndarray(source)
+    if arr is not None and len(arr) and _jitted(projection):
+        match _numba_call("max_by", projection, arr):
+            case Option(tag="some", some=result):
+                return result
+            case _:
+                pass
+
+    return builtins.max(builtins.map(projection, source))
 
 
 def min(source: Iterable[_TSupportsLessThan]) -> _TSupportsLessThan:
@@ -744,7 +1176,15 @@ def min(source: Iterable[_TSupportsLessThan]) -> _TSupportsLessThan:
 
 @curry_flip(1)
 def min_by(source: Iterable[_TSource], projection: Callable[[_TSource], _TSupportsLessThan]) -> _TSupportsLessThan:
-    return builtins.min(projection(x) for x in source)
+    arr = _ndarray(source)
+    if arr is not None and len(arr) and _jitted(projection):
+        match _numba_call("min_by", projection, arr):
+            case Option(tag="some", some=result):
+                return result
+            case _:
+                pass
+
+    return builtins.min(builtins.map(projection, source))
 
 
 def of(*args: _TSource) -> Seq[_TSource]:
@@ -764,6 +1204,92 @@ of_list = of_iterable
 """Alias to `seq.of_iterable`."""
 
 
+def _chunked(source: Iterable[_TSource], size: int) -> Iterator[list[_TSource]]:
+    it = builtins.iter(source)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+@curry_flip(1)
+def par_fold(
+    source: Iterable[_TSource],
+    folder: Callable[[_TSource, _TSource], _TSource],
+    state: _TSource,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> _TSource:
+    """Fold elements in sequence in parallel.
+
+    Folds chunks of the sequence on a pool of worker threads, then
+    folds the results of the chunks starting with the initial state.
+    The result is only the same as for `fold` if the folder is
+    associative, i.e `f(f(a, b), c) == f(a, f(b, c))`. Non-associative
+    folders such as subtraction must use `fold`.
+
+    Args:
+        source: The finite input sequence to fold.
+        folder: An associative function that combines two elements.
+        state: The initial state.
+        workers: The maximum number of worker threads.
+        chunk_size: The number of elements folded per task.
+
+    Returns:
+        Partially applied fold function that takes a source sequence and
+        returns the state object after the folding function is applied
+        to each element of the sequence.
+
+    Raises:
+        Raises `ValueError` if `chunk_size` is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    def _fold(chunk: list[_TSource]) -> _TSource:
+        return functools.reduce(folder, chunk)
+
+    with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+        results = executor.map(_fold, _chunked(source, chunk_size))
+        return functools.reduce(folder, results, state)
+
+
+@curry_flip(1)
+def par_map(
+    source: Iterable[_TSource],
+    mapper: Callable[[_TSource], _TResult],
+    workers: int | None = None,
+    chunk_size: int = 1000,
+) -> Iterable[_TResult]:
+    """Map source sequence in parallel.
+
+    Like map, but applies the mapper to chunks of the sequence on a
+    pool of worker threads, keeping the order of the elements. Iterating
+    the result submits all chunks at once, so the source must be finite.
+
+    Args:
+        source: The finite input sequence to map.
+        mapper: A function to transform items from the input sequence.
+        workers: The maximum number of worker threads.
+        chunk_size: The number of elements mapped per task.
+
+    Returns:
+        Partially applied map function.
+
+    Raises:
+        Raises `ValueError` if `chunk_size` is less than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    def _map(chunk: list[_TSource]) -> list[_TResult]:
+        return [mapper(x) for x in chunk]
+
+    def gen() -> Iterator[_TResult]:
+        with concurrent.futures.ThreadPoolExecutor(workers) as executor:
+            yield from itertools.chain.from_iterable(executor.map(_map, _chunked(source, chunk_size)))
+
+    return SeqGen(gen)
+
+
 @overload
 def range(stop: int) -> Iterable[int]:
     ...
@@ -802,6 +1328,35 @@ def scan(
         scanner: A function that updates the state with each element
         state: The initial state.
     """
+    return _scan(source, scanner, state)
+
+
+def _scan(
+    source: Iterable[_TSource],
+    scanner: Callable[[_TState, _TSource], _TState],
+    state: _TState,
+) -> Iterable[_TState]:
+    """Scan elements in sequence, without the currying of `scan`."""
+    arr = _ndarray(source)
+    if arr is not None:
+        match _ufunc_operands(scanner, state, arr):
+            case (ufunc, operands):
+                # The operands hold the state in the dtype of the scan, so yield the state itself
+                return itertools.chain((state,), ufunc.accumulate(operands, dtype=operands.dtype)[1:])
+            case _:
+                pass
+
+    if arr is not None and len(arr) and _jitted(scanner):
+        np = sys.modules["numpy"]
+        # The kernel stores the states in an array, so the state must be a scalar
+        if isinstance(state, int | float | complex | np.generic):
+            out = np.empty(len(arr) + 1, dtype=np.result_type(state, scanner(state, arr[0])))
+            match _numba_call("scan", scanner, arr, state, out):
+                case Option(tag="some", some=result):
+                    return itertools.chain((state,), result[1:])
+                case _:
+                    pass
+
     return itertools.accumulate(source, scanner, initial=state)
 
 
@@ -887,10 +1442,19 @@ def take(source: Iterable[_TSource], count: int) -> Iterable[_TSource]:
     return Seq()
 
 
-def to_list(source: Iterable[_TSource]) -> Block[_TSource]:
+@functools.cache
+def _block() -> type[Block[Any]]:
+    """Return the `Block` type, imported once on first use.
+
+    Block imports this module, so it cannot be imported at the top.
+    """
     from .block import Block
 
-    return Block.of_seq(source)
+    return Block
+
+
+def to_list(source: Iterable[_TSource]) -> Block[_TSource]:
+    return _block().of_seq(source)
 
 
 @curry_flip(1)
@@ -951,6 +1515,11 @@ def zip(
         Returns:
             The result sequence.
         """
+        arr1, arr2 = _ndarray(source1), _ndarray(source2)
+        if arr1 is not None and arr2 is not None:
+            n = builtins.min(len(arr1), len(arr2))
+            return _ZippedArrays(arr1[:n], arr2[:n])
+
         return builtins.zip(source1, source2)
 
     return _zip
@@ -965,18 +1534,22 @@ __all__ = [
     "delay",
     "empty",
     "filter",
+    "find",
     "fold",
     "fold_back",
     "head",
     "iter",
     "map",
     "mapi",
+    "map_filter_fold",
     "max",
     "min",
     "min_by",
     "of",
     "of_list",
     "of_iterable",
+    "par_fold",
+    "par_map",
     "range",
     "scan",
     "skip",
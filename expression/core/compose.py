@@ -139,7 +139,9 @@ def compose(*fns: Callable[[Any], Any]) -> Callable[[Any], Any]:
 
     def _compose(source: Any) -> Any:
         """Return a pipeline of composed functions."""
-        return reduce(lambda acc, f: f(acc), fns, source)
+        for fn in fns:
+            source = fn(source)
+        return source
 
     return _compose
 
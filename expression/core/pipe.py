@@ -14,7 +14,7 @@ Example:
 from collections.abc import Callable
 from typing import Any, TypeVar, TypeVarTuple, cast, overload
 
-from .compose import compose, starcompose
+from .compose import starcompose
 from .misc import starid
 
 
@@ -153,7 +153,9 @@ def pipe(__value: Any, *fns: Callable[[Any], Any]) -> Any:
         >>> pipe(x, fn, gn) == gn(fn(x))  # Same as x |> fn |> gn
         ...
     """
-    return compose(*fns)(__value)
+    for fn in fns:
+        __value = fn(__value)
+    return __value
 
 
 @overload
@@ -1,4 +1,5 @@
 import functools
+import operator
 from collections.abc import Callable, Iterable
 from itertools import accumulate
 from typing import Any, Optional
@@ -142,6 +143,84 @@ def test_seq_fold_fluent(xs: list[int], s: int):
     assert value == sum(xs) + s
 
 
+@given(st.lists(st.integers(), min_size=1))  # type: ignore
+def test_seq_max_by_min_by(xs: list[int]):
+    projection: Callable[[int], int] = lambda x: -abs(x)
+
+    assert pipe(xs, seq.max_by(projection)) == max(-abs(x) for x in xs)
+    assert pipe(xs, seq.min_by(projection)) == min(-abs(x) for x in xs)
+
+
+@given(st.lists(st.integers()), st.integers())  # type: ignore
+def test_seq_fold_back(xs: list[int], s: int):
+    folder: Callable[[int, list[int]], list[int]] = lambda x, s: [x, *s]
+    expected = functools.reduce(lambda s, x: folder(x, s), reversed(xs), [s])
+
+    assert seq.fold_back(folder, xs)([s]) == expected
+    assert seq.fold_back(folder, tuple(xs))([s]) == expected
+    assert seq.fold_back(folder, Seq(xs).map(lambda x: x))([s]) == expected
+    assert seq.fold_back(folder, Seq(tuple(xs)))([s]) == expected
+
+
+def test_seq_fold_back_does_not_copy_wrapped_list():
+    copies: list[Any] = []
+
+    class Spy(list[int]):
+        def __iter__(self):
+            copies.append(self)  # Copying with list() iterates forwards
+            return super().__iter__()
+
+    folder: Callable[[int, list[int]], list[int]] = lambda x, s: [x, *s]
+    assert seq.fold_back(folder, Seq(Spy([1, 2, 3])))([]) == [1, 2, 3]
+    assert copies == []
+
+
+@given(st.lists(st.integers()), st.integers(min_value=1, max_value=10))  # type: ignore
+def test_seq_par_map(xs: list[int], chunk_size: int):
+    mapper: Callable[[int], int] = lambda x: x * 10
+
+    ys = pipe(xs, seq.par_map(mapper, workers=4, chunk_size=chunk_size))
+    zs = Seq(xs).par_map(mapper, chunk_size=chunk_size)
+
+    assert list(ys) == [x * 10 for x in xs]
+    assert list(zs) == [x * 10 for x in xs]
+
+
+@given(st.lists(st.integers()), st.integers(), st.integers(min_value=1, max_value=10))  # type: ignore
+def test_seq_par_fold(xs: list[int], s: int, chunk_size: int):
+    value = pipe(xs, seq.par_fold(operator.add, s, workers=4, chunk_size=chunk_size))
+
+    assert value == sum(xs) + s
+    assert Seq(xs).par_fold(max, s, chunk_size=chunk_size) == max([s, *xs])
+
+
+@given(st.lists(st.integers(min_value=-100, max_value=100)), st.integers())  # type: ignore
+def test_seq_fold_operator(xs: list[int], s: int):
+    assert pipe(xs, seq.fold(operator.add, s)) == functools.reduce(operator.add, xs, s)
+    assert pipe(xs, seq.fold(operator.mul, s)) == functools.reduce(operator.mul, xs, s)
+
+
+@given(st.lists(st.floats(min_value=-1e6, max_value=1e6)), st.floats(min_value=-1e6, max_value=1e6))  # type: ignore
+def test_seq_fold_operator_add_floats(xs: list[float], s: float):
+    assert Seq(xs).fold(operator.add, s) == functools.reduce(operator.add, xs, s)
+    assert Seq([1e16, 1.0, -1e16]).fold(operator.add, 0.0) == 0.0  # Not compensated like sum
+
+
+@given(st.lists(st.text()), st.text())  # type: ignore
+def test_seq_fold_operator_add_strings(xs: list[str], s: str):
+    assert Seq(xs).fold(operator.add, s) == s + "".join(xs)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_seq_par_chunk_size_must_be_positive(chunk_size: int):
+    with pytest.raises(ValueError):
+        pipe([1, 2, 3], seq.par_fold(operator.add, 0, chunk_size=chunk_size))
+    with pytest.raises(ValueError):
+        pipe([1, 2, 3], seq.par_map(lambda x: x, chunk_size=chunk_size))
+    with pytest.raises(ValueError):
+        Seq([1, 2, 3]).par_map(lambda x: x, chunk_size=chunk_size)
+
+
 @given(st.integers(max_value=100))  # type: ignore
 def test_list_unfold(x: int):
     def unfolder(state: int) -> Option[tuple[int, int]]:
@@ -193,6 +272,14 @@ def test_seq_concat_3(xs: list[int], ys: list[int], zs: list[int]):
     assert list(value) == xs + ys + zs
 
 
+@given(st.lists(st.integers()), st.lists(st.integers()))  # type: ignore
+def test_seq_concat_iterate_twice(xs: list[int], ys: list[int]):
+    value = seq.concat(xs, ys)
+
+    assert list(value) == xs + ys
+    assert list(value) == xs + ys
+
+
 @given(st.lists(st.integers()), st.lists(st.integers()))  # type: ignore
 def test_seq_append_2(xs: list[int], ys: list[int]):
     value = pipe(xs, seq.append(ys))
@@ -277,6 +364,229 @@ def test_seq_pipeline(xs: list[int]):
     assert ys == functools.reduce(lambda s, x: s + x, filter(lambda x: x > 100, map(lambda x: x * 10, xs)), 0)
 
 
+@given(st.lists(st.integers()))  # type: ignore
+def test_seq_pipeline_fluent(xs: list[int]):
+    ys = Seq(xs).map(lambda x: x * 10).filter(lambda x: x > 100).map(lambda x: x + 1).filter(lambda x: x % 2 == 1)
+
+    expected = [x * 10 + 1 for x in xs if x * 10 > 100]
+    assert list(ys) == expected
+    assert list(ys) == expected  # Iterating again gives the same result
+
+
+@given(st.lists(st.integers()))  # type: ignore
+def test_seq_pipeline_mixed(xs: list[int]):
+    mapper: Callable[[int], int] = lambda x: x * 10
+    ys = Seq(xs).filter(lambda x: x > 0).pipe(seq.map(mapper), seq.collect(seq.singleton))
+
+    assert isinstance(ys, Seq)
+    assert list(ys) == [x * 10 for x in xs if x > 0]
+
+
+@given(st.lists(st.integers(min_value=-1000, max_value=1000)))  # type: ignore
+def test_seq_ndarray_ufunc_map_filter(xs: list[int]):
+    np = pytest.importorskip("numpy")
+    arr = np.array(xs, dtype=np.int64)
+
+    calls: list[int] = []
+
+    def negate(x: int) -> int:
+        calls.append(x)
+        return -x
+
+    ys = Seq(arr).map(np.negative)
+    zs = pipe(arr, seq.filter(np.signbit))
+    ws = Seq(arr).map(np.frompyfunc(negate, 1, 1))
+
+    assert calls == xs  # Vectorized ufuncs run eagerly over the whole array
+    assert list(ws) == [-x for x in xs]
+    assert list(ys) == [-x for x in xs]
+    assert list(zs) == [x for x in xs if x < 0]
+
+
+@given(st.lists(st.integers(min_value=-1000, max_value=1000)), st.integers(min_value=-1000, max_value=1000))  # type: ignore
+def test_seq_ndarray_fold(xs: list[int], s: int):
+    np = pytest.importorskip("numpy")
+    arr = np.array(xs, dtype=np.int64)
+
+    assert Seq(arr).fold(operator.add, s) == functools.reduce(operator.add, xs, s)
+    assert pipe(arr, seq.fold(max, s)) == functools.reduce(max, xs, s)
+    assert pipe(arr, seq.fold(min, s)) == functools.reduce(min, xs, s)
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@given(st.sampled_from(["int8", "uint8", "int32"]), st.data())  # type: ignore
+def test_seq_ndarray_fold_narrow_int(dtype: str, data: st.DataObject):
+    np = pytest.importorskip("numpy")
+    info = np.iinfo(dtype)
+    ints = st.integers(min_value=int(info.min), max_value=int(info.max))
+    arr = np.array(data.draw(st.lists(ints)), dtype=dtype)
+    s = data.draw(ints)
+
+    for folder in (operator.add, operator.mul, max, min):
+        expected = functools.reduce(folder, list(arr), s)
+        assert pipe(arr, seq.fold(folder, s)) == expected
+
+
+def test_seq_ndarray_fold_max_min_keeps_state():
+    np = pytest.importorskip("numpy")
+
+    result = pipe(np.array([200, 100], dtype=np.uint8), seq.fold(min, 5))
+    assert result == 5 and type(result) is int
+    assert pipe(np.array([1, 2], dtype=np.int32), seq.fold(min, True)) is True
+    assert type(pipe(np.array([1, 2], dtype=np.int32), seq.fold(max, 0))) is np.int32
+
+
+@given(st.lists(st.floats(min_value=-1e6, max_value=1e6, width=32)), st.floats(min_value=-1e6, max_value=1e6))  # type: ignore
+def test_seq_ndarray_fold_float32(xs: list[float], s: float):
+    np = pytest.importorskip("numpy")
+    arr = np.array(xs, dtype=np.float32)
+
+    result = pipe(arr, seq.fold(operator.add, s))
+    expected = functools.reduce(operator.add, list(arr), s)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@given(st.lists(st.integers(min_value=-100, max_value=100), max_size=8), st.integers(min_value=-100, max_value=100))  # type: ignore
+def test_seq_ndarray_scan(xs: list[int], s: int):
+    np = pytest.importorskip("numpy")
+    arr = np.array(xs, dtype=np.int64)
+
+    for scanner in (operator.add, operator.mul, max, min):
+        expected = list(accumulate(xs, scanner, initial=s))
+        result = list(pipe(arr, seq.scan(scanner, s)))
+        assert result == expected
+        assert type(result[0]) is int
+        assert list(Seq(arr).scan(scanner, s)) == expected
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@given(st.sampled_from(["int8", "uint8", "int32"]), st.data())  # type: ignore
+def test_seq_ndarray_scan_narrow_int(dtype: str, data: st.DataObject):
+    np = pytest.importorskip("numpy")
+    info = np.iinfo(dtype)
+    ints = st.integers(min_value=int(info.min), max_value=int(info.max))
+    arr = np.array(data.draw(st.lists(ints, max_size=8)), dtype=dtype)
+    s = data.draw(ints)
+
+    for scanner in (operator.add, operator.mul, max, min):
+        expected = list(accumulate(list(arr), scanner, initial=s))
+        assert list(pipe(arr, seq.scan(scanner, s))) == expected
+
+
+@given(st.lists(st.floats(min_value=-1e6, max_value=1e6, width=32)), st.floats(min_value=-1e6, max_value=1e6))  # type: ignore
+def test_seq_ndarray_scan_float32(xs: list[float], s: float):
+    np = pytest.importorskip("numpy")
+    arr = np.array(xs, dtype=np.float32)
+
+    result = list(pipe(arr, seq.scan(operator.add, s)))
+    assert result == list(accumulate(list(arr), operator.add, initial=s))
+    assert result[0] is s
+    assert all(type(x) is np.float32 for x in result[1:])
+
+
+def test_seq_ndarray_scan_max_complex_state():
+    np = pytest.importorskip("numpy")
+
+    arr = np.array([1, 2])
+    for scanner in (max, min):
+        expected = list(accumulate(list(arr), scanner, initial=1j))
+        assert list(pipe(arr, seq.scan(scanner, 1j))) == expected
+
+
+def test_seq_ndarray_jitted_reductions():
+    np = pytest.importorskip("numpy")
+    numba = pytest.importorskip("numba")
+
+    folder = numba.njit(lambda s, x: s + x * 2)
+    projection = numba.njit(lambda x: -((x - 3) ** 2))
+    xs = list(range(10))
+    arr = np.array(xs)
+
+    assert pipe(arr, seq.fold(folder, 1)) == functools.reduce(lambda s, x: s + x * 2, xs, 1)
+    assert list(Seq(arr).scan(folder, 0.5)) == list(accumulate(xs, lambda s, x: s + x * 2, initial=0.5))
+    assert pipe(arr, seq.max_by(projection)) == max(-((x - 3) ** 2) for x in xs)
+    assert pipe(arr, seq.min_by(projection)) == min(-((x - 3) ** 2) for x in xs)
+
+
+def test_seq_ndarray_jitted_scan_tuple_state():
+    np = pytest.importorskip("numpy")
+    numba = pytest.importorskip("numba")
+
+    scanner = numba.njit(lambda s, x: (s[0] + x, s[1]))
+    arr = np.arange(8)
+
+    expected = list(accumulate(list(arr), lambda s, x: (s[0] + x, s[1]), initial=(0, 0)))
+    assert list(pipe(arr, seq.scan(scanner, (0, 0)))) == expected
+
+
+@given(st.lists(st.integers()))  # type: ignore
+def test_seq_map_filter_fold(xs: list[int]):
+    calls: list[int] = []
+
+    def mapper(x: int) -> int:
+        calls.append(x)
+        return x * 10
+
+    predicate: Callable[[int], bool] = lambda x: x > 100
+    folder: Callable[[int, int], int] = lambda s, x: s + x
+    expected = functools.reduce(folder, filter(predicate, map(lambda x: x * 10, xs)), 0)
+
+    assert Seq(xs).map_filter_fold(mapper, predicate, folder, 0) == expected
+    assert Seq(xs).filter(lambda x: x > -5).map(mapper).filter(predicate).fold(folder, 0) == functools.reduce(
+        folder, filter(predicate, map(lambda x: x * 10, filter(lambda x: x > -5, xs))), 0
+    )
+    assert len(calls) == len(xs) + len([x for x in xs if x > -5])
+
+
+@given(st.lists(st.integers()), st.integers())  # type: ignore
+def test_seq_find(xs: list[int], y: int):
+    predicate: Callable[[int], bool] = lambda x: x > y
+    matches = [x for x in xs if x > y]
+
+    if matches:
+        assert pipe(xs, seq.find(predicate)) == matches[0]
+        assert Seq(xs).find(predicate) == matches[0]
+    else:
+        with pytest.raises(ValueError):
+            pipe(xs, seq.find(predicate))
+
+
+def test_seq_find_stops_mapping_at_first_match():
+    calls: list[int] = []
+
+    def mapper(x: int) -> int:
+        calls.append(x)
+        return x * 10
+
+    xs = seq.infinite
+
+    assert Seq(xs).map(mapper).find(lambda x: x > 30) == 40
+    assert calls == [0, 1, 2, 3, 4]
+    assert Seq(xs).map(mapper).filter(lambda x: x % 20 == 0).find(lambda x: x > 30) == 40
+    with pytest.raises(ValueError):
+        Seq([1, 2]).filter(lambda x: x > 0).map(mapper).find(lambda x: x > 30)
+
+
+def test_seq_ndarray_jitted_fold_falls_back():
+    np = pytest.importorskip("numpy")
+    numba = pytest.importorskip("numba")
+
+    calls: list[int] = []
+
+    def append(s: str, x: int) -> str:
+        calls.append(x)
+        return s + str(x)
+
+    # Object mode functions are jitted but cannot be called from the
+    # nopython kernel, so compiling it for a str state fails
+    folder = numba.jit(append, forceobj=True)
+    arr = np.arange(3)
+
+    assert pipe(arr, seq.fold(folder, "")) == "012"
+    assert calls == [0, 1, 2]  # Folded once, by functools.reduce
+
+
 @given(st.lists(st.integers()))  # type: ignore
 def test_seq_delay(xs: list[int]):
     ran = False
@@ -310,6 +620,20 @@ def test_seq_choose_option_fluent():
     assert list(ys) == [42]
 
 
+def test_seq_init_infinite_cache():
+    calls: list[int] = []
+
+    def initializer(i: int) -> int:
+        calls.append(i)
+        return i * 10
+
+    xs = seq.init_infinite(initializer, cache=10)
+
+    assert list(pipe(xs, seq.take(5))) == [0, 10, 20, 30, 40]
+    assert list(pipe(xs, seq.take(5))) == [0, 10, 20, 30, 40]
+    assert calls == [0, 1, 2, 3, 4]
+
+
 @given(st.lists(st.integers()))  # type: ignore
 def test_seq_infinite(xs: list[int]):
     ys = pipe(xs, seq.zip(seq.infinite))
@@ -318,6 +642,28 @@ def test_seq_infinite(xs: list[int]):
     assert expected == list(ys)
 
 
+@given(st.lists(st.integers(min_value=-1000, max_value=1000)), st.lists(st.integers(min_value=-1000, max_value=1000)))  # type: ignore
+def test_seq_ndarray_zip_starmap(xs: list[int], ys: list[int]):
+    np = pytest.importorskip("numpy")
+    arr1, arr2 = np.array(xs, dtype=np.int64), np.array(ys, dtype=np.int64)
+
+    calls: list[tuple[int, int]] = []
+
+    def add(x: int, y: int) -> int:
+        calls.append((x, y))
+        return x + y
+
+    pairs = Seq(arr1).zip(arr2)
+    zs = Seq(pairs).starmap(np.add)
+    ws = Seq(pairs).starmap(np.frompyfunc(add, 2, 1))
+
+    assert calls == list(zip(xs, ys))  # Vectorized over the columns before iteration
+    assert list(pairs) == list(zip(xs, ys))
+    assert list(ws) == [x + y for x, y in zip(xs, ys)]
+    assert list(zs) == [x + y for x, y in zip(xs, ys)]
+    assert list(pipe(pairs, seq.map2(lambda x, y: x * y))) == [x * y for x, y in zip(xs, ys)]
+
+
 rtn: Callable[[int], Seq[int]] = seq.singleton
 empty: Seq[int] = seq.empty
 